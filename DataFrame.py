@@ -1,6 +1,8 @@
 from __future__ import annotations
 from typing import Sequence, Union, TypeAlias, Any, Generator, Literal, TYPE_CHECKING
 from collections.abc import Sequence as TypeSequence
+from itertools import zip_longest
+from io import StringIO
 from Index import Index
 from MultiIndex import MultiIndex
 from Series import Series
@@ -12,6 +14,7 @@ BasicSequenceNotStr : TypeAlias = Union[list[Basic], tuple[Basic, ...]]
 
 class DataFrame(object):
     def __init__(self, data : list[list] | list[dict[Basic, list[Any]]] | dict[Basic, list[Any]], index : list | Index | MultiIndex = None, columns : list | Index | MultiIndex = None):
+        self._data = []
         self._initialize_data(data)
 
         if index is not None:
@@ -45,95 +48,103 @@ class DataFrame(object):
                 index = Index(index)
             self._index = index
 
-    def _initialize_data(self, data : list[list] | list[dict[Basic, list[Any]]] | dict[Basic, list[Any]]) -> None:
+    def _initialize_from_dict(self, data : dict[Basic, list[Any]] | dict[Basic, dict[Basic, Any]]) -> None:
+        '''This method fills the DataFrame from a dict of columns (lists) or a dict of rows (dicts).'''
+        
         if not data:
             return
         
-        if isinstance(data, dict):
-            if isinstance(data[list(data.keys())[0]], list):
-                new_data = list(data.values())
-                max_length = max([len(column) for column in new_data])
-                new_data = [column.extend([None for _ in max_length - len(column)]) for column in data.values()]
-                
-                self._data = new_data
-                
-                self.columns = list(data.keys())
-                self.index = [i for i in range(max_length)]
-                
-            elif isinstance(data[list(data.keys())[0]], dict):
-                rows = list(data.keys())
-                
-                all_columns = []
-                for column_keys in data.values().keys():
-                    for column_key in column_keys:
-                        if column_key not in all_columns:
-                            all_columns.append(column_key)
+        first_value = next(iter(data.values()))
+        
+        if isinstance(first_value, list):
+            columns = list(data.values())
+            max_length = max([len(column) for column in columns])
+            new_data = [column + [None] * (max_length - len(column)) for column in columns]
+            
+            self._data = new_data
+            
+            self.columns = list(data.keys())
+            self.index = [i for i in range(max_length)]
+            
+        elif isinstance(first_value, dict):
+            rows = list(data.keys())
+            
+            all_columns = []
+            for column_keys in data.values().keys():
+                for column_key in column_keys:
+                    if column_key not in all_columns:
+                        all_columns.append(column_key)
 
-                new_data = [[] for _ in range(len(all_columns))]
-                
-                for row_key in rows:
-                    row = data[row_key]
-                    for i, column in enumerate(all_columns):
-                        if column in data[row]:
-                            new_data[i].append(data[row[column]])
-                        else:
-                            new_data[i].append(None)
-                
-                self._data = new_data
-                
-                self.columns = all_columns
-                self.index = rows
-                
-        elif isinstance(data, list):
-            if isinstance(data[0], dict):
-                new_data = {i : data[i] for i in range(len(data))}
-                self._initialize_data(new_data)
-                
-            elif isinstance(data[0], list):
-                max_length = max([len(row) for row in data])
-                
-                new_data = [[] for _ in range(max_length)]
-                
-                for row in data:
-                    row.extend([None for _ in range(max_length - len(row))])
-                    for i, item in enumerate(row):
-                        new_data[i].append(item)
-                
-                self._data = new_data
-                
-                self.columns = [i for i in range(max_length)]
-                self.index = [i for i in range(len(data))]
+            new_data = [[] for _ in range(len(all_columns))]
+            
+            for row_key in rows:
+                row = data[row_key]
+                for i, column in enumerate(all_columns):
+                    if column in data[row]:
+                        new_data[i].append(data[row[column]])
+                    else:
+                        new_data[i].append(None)
+            
+            self._data = new_data
+            
+            self.columns = all_columns
+            self.index = rows
+    
+    def _initialize_from_list(self, data : list[list] | list[dict[Basic, Any]] | list[Series]) -> None:
+        '''This method fills the DataFrame from a list of rows, given either as lists, dicts or Series.'''
         
-            elif isinstance(data[0], Series):
-                self._initialize_data([series.to_dict() for series in data])
+        if not data:
+            return
+        
+        if isinstance(data[0], list):
+            new_data = [list(column) for column in zip_longest(*data, fillvalue = None)]
             
-            else:
-                raise TypeError(f"\"{type(data[0])}\" is not a valid type for creating a DataFrame.")
+            self._data = new_data
+            
+            self.columns = [i for i in range(len(new_data))]
+            self.index = [i for i in range(len(data))]
+        
+        elif isinstance(data[0], dict):
+            new_data = {i : data[i] for i in range(len(data))}
+            self._initialize_from_dict(new_data)
+    
+        elif isinstance(data[0], Series):
+            self._initialize_from_list([series.to_dict() for series in data])
         
         else:
+            raise TypeError(f"\"{type(data[0])}\" is not a valid type for creating a DataFrame.")
+    
+    _INITIALIZE_DISPATCH = {dict : _initialize_from_dict, list : _initialize_from_list}
+    
+    def _initialize_data(self, data : list[list] | list[dict[Basic, list[Any]]] | dict[Basic, list[Any]]) -> None:
+        '''This method fills the DataFrame from the data it was created with, using the constructor for the type of the data (dict or list).'''
+        
+        handler = DataFrame._INITIALIZE_DISPATCH.get(type(data))
+        if handler is None:
+            handler = next((initializer for kind, initializer in DataFrame._INITIALIZE_DISPATCH.items() if isinstance(data, kind)), None)
+        
+        if handler is not None:
+            handler(self, data)
+        elif data:
             raise TypeError(f"{type(data)} is not a valid type for creating a DataFrame.")
         
     def to_list(self) -> list[list[Any]]:
         return self._data
     
     def to_list_of_rows(self) -> list[list[Any]]:
-        rows = [[] for _ in range(len(self))]
-        for column_index in range(len(self._data)):
-            for row_index in range(len(rows)):
-                data = self._data[column_index][row_index]
-                if data is not None:
-                    rows[row_index].append(data)
-        return rows
+        return [list(row) for row in zip(*self._data)]
         
     def __len__(self):
+        if not self._data:
+            return 0
         return len(self._data[0])
 
     def __str__(self):
-        pretty_print = f"columns: {str(self.columns.to_list())}\n".replace("[", "").replace("]", "")
-        list_of_rows = self.to_list_of_rows()
-        for i in range(len(list_of_rows)):
-            pretty_print += f"{self.index[i]} : {list_of_rows[i]}\n"
-        return pretty_print
+        pretty_print = StringIO()
+        pretty_print.write(f"columns: {', '.join(map(repr, self.columns.to_list()))}\n")
+        for label, row in zip(self.index, zip(*self._data)):
+            pretty_print.write(f"{label} : {list(row)}\n")
+        return pretty_print.getvalue()
 
 if __name__ == "__main__":
     dataframe = DataFrame([[1,2], [2,3]])
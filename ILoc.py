@@ -22,16 +22,21 @@ class iLoc(object):
     
     def __setitem__(self, index : int | list[int] | list[bool] | slice, new_data : Any) -> None:
         
-        if isinstance(index, int):
+        index_type = type(index)
+        if index_type is not int and index_type is not list and index_type is not slice:
+            index_type = next((kind for kind in (int, list, slice) if isinstance(index, kind)), None)
+        
+        if index_type is int:
             self._data._set_item_from_int_index(index, new_data)
-        elif isinstance(index, list):
-            if isinstance(index[0], bool):
+        elif index_type is list:
+            first_type = type(index[0]) if index else int
+            if first_type is bool:
                 self._data._set_items_from_mask(index, new_data)
-            elif isinstance(index[0], int):
+            elif issubclass(first_type, int):
                 self._data._set_items_from_int_indexes(index, new_data)
             else:
                 raise TypeError("iLoc only takes list of integeres or a mask of booleans.")
-        elif isinstance(index, slice):
+        elif index_type is slice:
             self._data._set_items_from_int_slice(index, new_data)
         else:
             raise TypeError("iLoc only takes either int, list of ints, mask of booleans or slice made up of int indexes.")
\ No newline at end of file
@@ -1,6 +1,9 @@
 from __future__ import annotations
 from typing import Union, TypeAlias, Any, Literal
 from collections.abc import Sequence as TypeSequence
+from array import array
+from bisect import bisect_left, insort
+from itertools import compress, chain
 
 BasicTuple : TypeAlias = tuple[Union[str, int, float], ...]
 Basic : TypeAlias = Union[int, str, float, BasicTuple]
@@ -9,10 +12,11 @@ BasicSequenceNotStr : TypeAlias = Union[list[Basic], tuple[Basic, ...]]
 
 class Index(object):
     def __init__(self, sequence : BasicSequenceNotStr = None, cache : bool = True):
-        self._index = []
-        self._mapping = {}
+        self._index = array("q")
+        self._uniques = []
         self._reverse_mapping = {}
         self._cache = None
+        self._is_unique = None
         
         if sequence:
             self._extend_index(sequence)
@@ -56,18 +60,23 @@ class Index(object):
     @staticmethod
     def _verify_sequence(sequence : BasicSequenceNotStr) -> None:
         '''This method checks whether the items inside the sequence as well as the sequence itself is valid or not.
-        The sequence must not be a string or bytes.'''
+        The sequence must not be a string or bytes.
+        Sequences made up of only ints and strs (the common case) are accepted after a single pass over the item types,
+        only other sequences have every item verified individually.'''
         
         if not isinstance(sequence, TypeSequence):
             raise TypeError("Input must be a sequence.")
         elif isinstance(sequence, (str, bytes)):
             raise TypeError("Sequence cannot be a string or bytes.")
+        elif set(map(type, sequence)) <= {int, str}:
+            return
         else:
             for item in sequence:
                 Index._verify_item(item)
     
     def _update_mappings_with_single_item(self, new_mapping : Basic, verify_entry : bool = True) -> None:
-        '''This method updates both the mappings (self._mapping & self._reverse_mapping) with a single new mapping.
+        '''This method updates both the mappings (self._uniques & self._reverse_mapping) with a single new mapping.
+        Since internal forms are handed out as 0, 1, 2..., self._uniques is a plain list indexed by the internal form.
         It has an optional argument "verify_entry" which is True by default but can be set to false,
         if you would like the method not to verify the new mapping.'''
         
@@ -76,35 +85,38 @@ class Index(object):
         
         if new_mapping not in self._reverse_mapping:
             length = len(self._reverse_mapping)
-            self._mapping[length] = new_mapping
+            self._uniques.append(new_mapping)
             self._reverse_mapping[new_mapping] = length
     
     def _update_mappings_with(self, new_mappings : list[Basic] | Basic, verify_entries : bool = True) -> None:
-        '''This method updates both the mappings (self._mapping & self._reverse mapping) with new mapping(s).
-        This method internally called self._update_mappings_with_single_item to update the mappings.
-        The only difference between the two methods is that this method can update with multiple new mappings instead of just one.'''
+        '''This method updates both the mappings (self._uniques & self._reverse mapping) with new mapping(s).
+        A single new mapping is handed over to self._update_mappings_with_single_item,
+        while a list of new mappings is added in bulk: the values not mapped yet are collected in one pass
+        and both mappings are then extended at once.'''
         
         if isinstance(new_mappings, list):
             if verify_entries:
                 self._verify_sequence(new_mappings)
 
-            new_mappings = set(new_mappings)
-            for new_mapping in new_mappings:
-                self._update_mappings_with_single_item(new_mapping, verify_entry = False)
+            reverse_mapping = self._reverse_mapping
+            new_items = [item for item in dict.fromkeys(new_mappings) if item not in reverse_mapping]
+            first_internal_form = len(reverse_mapping)
+            reverse_mapping.update(zip(new_items, range(first_internal_form, first_internal_form + len(new_items))))
+            self._uniques.extend(new_items)
 
         else:
             self._update_mappings_with_single_item(new_mappings)
         
     def _create_cache(self) -> None:
-        '''The method creates an internal cache for faster (O(1)) lookups.'''
+        '''The method creates an internal cache for faster (O(1)) lookups.
+        All the buckets are created up front, so filling them takes a single dictionary lookup per row.'''
         
-        self._cache = {}
+        cache = {key : [] for key in dict.fromkeys(self._index)}
         
         for index, item in enumerate(self._index):
-            if item not in self._cache:
-                self._cache[item] = [index]
-            else:
-                self._cache[item].append(index)
+            cache[item].append(index)
+        
+        self._cache = cache
     
     def flush_cache(self) -> None:
         '''This method sets the cache to None, freeing up any space that might have been previously taken up by the cache.'''
@@ -120,14 +132,20 @@ class Index(object):
         
         self._verify_sequence(sequence)
         
-        uniques = list(set(sequence))
+        uniques = list(dict.fromkeys(sequence))
         self._update_mappings_with(uniques, verify_entries=False)
         
-        for item in sequence:
-            self._index.append(self._reverse_mapping[item])
-
-            if self._cache is not None:
-                self._update_cache("add", {self._reverse_mapping[item] : [(len(self)-1)]}, by_internal_form = True)
+        reverse_mapping = self._reverse_mapping
+        internal_forms = [reverse_mapping[item] for item in sequence]
+        first_new_row = len(self._index)
+        self._index.extend(internal_forms)
+        self._is_unique = None
+        
+        if self._cache is not None:
+            new_rows = {}
+            for offset, internal_form in enumerate(internal_forms):
+                new_rows.setdefault(internal_form, []).append(first_new_row + offset)
+            self._update_cache("add", new_rows, by_internal_form = True)
     
     def get_loc(self, index : Basic, get_all : bool = True, give_error : bool = True) -> int | list[int] | None:
         '''This method returns the interger index location of the provided index.
@@ -137,25 +155,81 @@ class Index(object):
         "give_error" - which is by default true will raise an error if the provided index is not found anywhere in the index.
         It can be set to false to not give an error and instead return None if the provided index is not found anywhere in the index.'''
         
-        self._verify_item(index)
-        
-        if index not in self._reverse_mapping:
+        try:
+            internal_form = self._reverse_mapping[index]
+        except (KeyError, TypeError):
+            self._verify_item(index)
             if give_error:
-                raise KeyError(f"\"{index}\" is not present inside the index.")
+                raise KeyError(f"\"{index}\" is not present inside the index.") from None
             else:
                 return None
-            
-        internal_form = self._reverse_mapping[index]
         
         if not get_all:
             if self._cache is not None:
-                return self._cache[internal_form][0]
-            return self._index.index(internal_form)
+                locations = self._cache.get(internal_form)
+                if locations:
+                    return locations[0]
+            else:
+                try:
+                    return self._index.index(internal_form)
+                except ValueError:
+                    pass
+            
+            if give_error:
+                raise KeyError(f"\"{index}\" is not present inside the index.")
+            else:
+                return None
 
         else:
             if self._cache is not None:
-                return self._cache[internal_form]
-            return [i for i, key in enumerate(self._index) if key == internal_form]
+                return self._cache.get(internal_form, [])
+            return list(compress(range(len(self._index)), map(internal_form.__eq__, self._index)))
+        
+    def get_loc_last(self, index : Basic) -> int:
+        '''This method returns the integer index location of the last appearance of the provided index.
+        The cached locations of every index are kept sorted, so the last one is read off the end of its list without scanning it.
+        It raises an error if the provided index is not present inside the index.'''
+        
+        try:
+            internal_form = self._reverse_mapping[index]
+        except (KeyError, TypeError):
+            self._verify_item(index)
+            raise KeyError(f"\"{index}\" is not present inside the index.") from None
+        
+        if self._cache is not None:
+            locations = self._cache.get(internal_form)
+            if not locations:
+                raise KeyError(f"\"{index}\" is not present inside the index.")
+            return locations[-1]
+        
+        internal_index = self._index
+        position = next((position for position in range(len(internal_index) - 1, -1, -1) if internal_index[position] == internal_form), None)
+        if position is None:
+            raise KeyError(f"\"{index}\" is not present inside the index.")
+        return position
+    
+    def get_indexer(self, labels : BasicSequenceNotStr) -> list[int]:
+        '''This method returns the integer index locations of every label inside "labels" in a single call, in the order of the labels.
+        Labels that appear more than once inside the index contribute every one of their locations.
+        It raises the same errors as get_loc if any of the labels is not a valid index or is not present inside the index.'''
+        
+        reverse_mapping = self._reverse_mapping
+        try:
+            internal_forms = [reverse_mapping[label] for label in labels]
+        except (KeyError, TypeError):
+            for label in labels:
+                self.get_loc(label)
+            raise
+        
+        if self._cache is not None:
+            cache = self._cache
+            return list(chain.from_iterable([cache.get(internal_form, []) for internal_form in internal_forms]))
+        
+        locations = {internal_form : [] for internal_form in internal_forms}
+        for position, internal_form in enumerate(self._index):
+            if internal_form in locations:
+                locations[internal_form].append(position)
+        return list(chain.from_iterable([locations[internal_form] for internal_form in internal_forms]))
         
     def _update_cache(self, operation : Literal["add", "remove"], operation_args : dict[int, list[int]], by_internal_form : bool = True) -> None:
         '''This method is used to update the cache (if it exists) with the provided operation_arguments. This method takes the following arguments:
@@ -163,7 +237,9 @@ class Index(object):
         "operation_args" argument must be a dictionary with key representing the index you would like to add or remove from,
         while the values must be a list representing the integer indexes where the value should be added or removed from.
         "by_internal_form" argument - which must be a bool, tells the method whether the key in operation_args dict is the index's internal representation or not.
-        If False, the method automatically converts it to it's internal form and then applies the operation on the cache.'''
+        If False, the method automatically converts it to it's internal form and then applies the operation on the cache.
+        Every bucket in the cache is kept sorted, so rows are inserted and removed with a binary search instead of a linear scan,
+        and buckets that become empty are dropped so the cache only ever holds the values actually present in the index.'''
         
         if self._cache is None:
             return
@@ -185,44 +261,48 @@ class Index(object):
         else:
             internal_forms = list(operation_args.keys())
         
+        length = len(self)
+        
         for i, index in enumerate(operation_args.keys()):
             rows = operation_args[index]
             for row in rows:
-                if row >= len(self):
+                if row >= length:
                     raise IndexError(f"Index \"{row}\" out of bounds.")
                 if operation == "add":
                     if internal_forms[i] in self._cache:
-                        self._cache[internal_forms[i]].append(row)
+                        insort(self._cache[internal_forms[i]], row)
                     else:
                         self._cache[internal_forms[i]] = [row]
                 else:
-                    if row not in self._cache[internal_forms[i]]:
+                    bucket = self._cache.get(internal_forms[i], [])
+                    position = bisect_left(bucket, row)
+                    if position == len(bucket) or bucket[position] != row:
                         raise ValueError(f"\"{row}\" not found in cache for Index \"{internal_forms[i]}\". The index at {row} is {self[row]}.")
-                    self._cache[internal_forms[i]].remove(row)
-            self._cache[internal_forms[i]].sort()
+                    del bucket[position]
+                    if not bucket:
+                        del self._cache[internal_forms[i]]
 
     def to_list(self) -> list[Basic]:
         '''This method is to get the entire index in the form of a list, with its original values.'''
         
-        return [self._mapping[key] for key in self._index]
+        return list(map(self._uniques.__getitem__, self._index))
     
     def is_unique(self) -> bool:
-        '''This method returns True if all the values inside of the index are unique, else it returns False.'''
+        '''This method returns True if all the values inside of the index are unique, else it returns False.
+        The result is memoized until the index is changed again.'''
         
-        if self._cache is not None:
-            return len(self) == len(self._cache)
+        if self._is_unique is None:
+            if self._cache is not None:
+                self._is_unique = len(self) == len(self._cache)
+            else:
+                self._is_unique = len(self) == len(set(self._index))
         
-        return len(self) == len(set(self._index))
+        return self._is_unique
     
     def unique(self) -> list[Basic]:
-        '''This method returns all the unique values in the index.'''
-        
-        uniques = []
-        for key in self._index:
-            original_value = self._mapping[key]
-            if original_value not in uniques:
-                uniques.append(original_value)
-        return uniques
+        '''This method returns all the unique values in the index, in the order of their first appearance.'''
+        
+        return list(map(self._uniques.__getitem__, dict.fromkeys(self._index)))
     
     def _get_correct_slice(self, index : slice) -> slice:
         '''This is a major method of the Index. This method corrects the slice provided in such a way that:
@@ -295,7 +375,7 @@ class Index(object):
         if index < 0 or index >= len(self):
             raise TypeError(f"Index out of bounds.")
         
-        return self._mapping[self._index[index]]
+        return self._uniques[self._index[index]]
     
     def _get_items_from_int_indexes(self, index : list) -> list[Basic]:
         '''This is a helper method of __getitem__ dunder method.
@@ -318,23 +398,21 @@ class Index(object):
         if len(mask) != len(self):
             raise IndexError("Length of the mask must match the length of the index.")
         
-        indexes = []
-        
-        for index, Bool in enumerate(mask):
-            if not isinstance(Bool, bool):
-                raise TypeError(f"All entries inside the mask need to be a boolean, not \"{type(Bool)}\".")
-            if Bool:
-                indexes.append(index)
+        invalid_types = set(map(type, mask))
+        invalid_types.discard(bool)
+        if invalid_types:
+            raise TypeError(f"All entries inside the mask need to be a boolean, not \"{invalid_types.pop()}\".")
 
-        return indexes
+        return list(compress(range(len(mask)), mask))
     
     def _append(self, item : Basic) -> None:
         '''This method is used to add one new index to the end of the index.'''
         
         self._update_mappings_with_single_item(item)
         self._index.append(self._reverse_mapping[item])
+        self._is_unique = None
         if self._cache is not None:
-            self._update_cache("add", {item : (len(self) - 1)}, by_internal_form = False)
+            self._update_cache("add", {item : [len(self) - 1]}, by_internal_form = False)
     
     def _get_items_from_slice(self, index : slice) -> list[Basic]:
         '''This method returns a list of all the original values of the index coming under the provided slice,
@@ -344,7 +422,8 @@ class Index(object):
             raise TypeError("_get_items_from_slice only takes a slice.")
         
         corrected_slice = self._get_correct_slice(index)
-        return [self._mapping[item] for item in self._index[corrected_slice]]
+        uniques = self._uniques
+        return [uniques[item] for item in self._index[corrected_slice]]
     
     def _set_item_by_int_index(self, item : Basic, index : int, verify_item : bool = True) -> None:
         '''This method is used to replace the index with a new index at the provided index.
@@ -369,6 +448,7 @@ class Index(object):
         
         previous_item_internal_form = self._index[index]
         self._index[index] = internal_form
+        self._is_unique = None
         
         if self._cache is not None:
             self._update_cache("remove", {previous_item_internal_form : [index]})
@@ -382,8 +462,29 @@ class Index(object):
         if not isinstance(indexes, list):
             raise TypeError("_set_items_by_int_indexes only takes a list of integer indexes.")
         
+        if not all(isinstance(index, int) for index in indexes):
+            raise TypeError("_set_items_by_int_indexes only takes a list of integer indexes.")
+        
+        length = len(self)
+        indexes = list(dict.fromkeys([length + index if index < 0 else index for index in indexes]))
+        if any(index < 0 or index >= length for index in indexes):
+            raise IndexError("Index out of bounds.")
+        
+        if item not in self._reverse_mapping:
+            self._update_mappings_with_single_item(item, verify_entry = False)
+        
+        internal_form = self._reverse_mapping[item]
+        
+        if self._cache is not None:
+            previous_rows = {}
+            for index in indexes:
+                previous_rows.setdefault(self._index[index], []).append(index)
+            self._update_cache("remove", previous_rows)
+            self._update_cache("add", {internal_form : indexes})
+        
         for index in indexes:
-            self._set_item_by_int_index(item, index, verify_item = False)
+            self._index[index] = internal_form
+        self._is_unique = None
     
     def _get_int_indexes_from_slice(self, index : slice) -> list[int]:
         '''This method is an internal helper method that returns a list consisting of all the valid numerical indexes
@@ -407,12 +508,7 @@ class Index(object):
             else:
                 stop = -1
         
-        int_indexes = []
-        while (step > 0 and start < stop) or (step < 0 and start > stop):
-            int_indexes.append(start)
-            start += step
-
-        return int_indexes
+        return list(range(start, stop, step))
     
     def __setitem__(self, index : int | list[int] | list[bool] | slice, item : Basic) -> None:
         '''This method can be used to set new index(s) to multiple integer indexes.
@@ -422,9 +518,10 @@ class Index(object):
         if isinstance(index, int):
             self._set_item_by_int_index(item, index)
         elif isinstance(index, list):
-            if isinstance(index[0], bool):
+            first_type = type(index[0]) if index else int
+            if first_type is bool:
                 self._set_items_by_int_indexes(item, self._get_int_indexes_from_mask(index))
-            elif isinstance(index[0], int):
+            elif issubclass(first_type, int):
                 self._set_items_by_int_indexes(item, index)
             else:
                 raise TypeError(f"\"{type(index[0])}\" is not a valid type as index specifier for setting items. You can use int index, list of int indexes, mask of booleans or slice for setting items.")
@@ -441,19 +538,22 @@ class Index(object):
         if isinstance(index, int):
             return self._get_item_from_int_index(index)
         elif isinstance(index, list):
-            if isinstance(index[0], bool):
+            first_type = type(index[0]) if index else int
+            if first_type is bool:
                 return self._get_items_from_int_indexes(self._get_int_indexes_from_mask(index))
-            elif isinstance(index[0], int):
+            elif issubclass(first_type, int):
                 return self._get_items_from_int_indexes(index)
+            else:
+                raise TypeError(f"\"{first_type}\" is not a valid type as index specifier for getting items. Index only supports ints, list of ints, mask of booleans or slice for getting items.")
         elif isinstance(index, slice):
             return self._get_items_from_slice(index)
         else:
             raise TypeError(f"\"{type(index)}\" is not a valid type. Index only supports ints, list of ints, mask of booleans or slice for getting items.")
         
     def __iter__(self):
+        '''This method returns an iterator over the original values of the index.'''
         
-        for key in self._index:
-            yield self._mapping[key]
+        return map(self._uniques.__getitem__, self._index)
     
     def __len__(self):
         
@@ -461,7 +561,7 @@ class Index(object):
 
     def __str__(self) -> str:
         
-        original_values = [self._mapping[key] for key in self._index]
+        original_values = self.to_list()
         return str(original_values) + f"\n\ntype : {__class__.__name__}, length: {len(self)}"
     
 if __name__ == "__main__":
@@ -12,63 +12,111 @@ BasicSequenceNotStr : TypeAlias = Union[list[Basic], tuple[Basic, ...]]
 if TYPE_CHECKING:
     from Series import Series
 
+_LABEL_TYPES = (int, str, float)
+
+def _raise_unsupported(index : Any) -> None:
+    '''This function raises the error for an indexer type Loc does not support, kept out of the dispatch path.'''
+    
+    raise TypeError(f"\"{type(index)}\" is not supported.")
+
 class Loc(object):
     def __init__(self, data : Series):
         self._data = data
     
-    def _get_correct_slice_from_slice_of_items(self, index : slice[Basic, Basic, int]) -> slice:
+    @staticmethod
+    def _is_mask(index : list[Basic] | list[bool]) -> bool:
+        '''This method tells a mask of booleans apart from a list of labels by the exact type of its first entry.
+        An empty list is treated as an empty list of labels, so it selects nothing instead of failing on index[0].'''
+        
+        return bool(index) and type(index[0]) is bool
+
+    def _get_from_label(self, index : Basic) -> Series:
+        
+        return self._data._get_data_from_iloc(self._data.index.get_loc(index))
+    
+    def _get_from_tuple(self, index : BasicTuple) -> Series:
+        
+        return self._data._get_data_from_iloc(self._data.index.get_indexer((index,)))
+    
+    def _get_from_list(self, index : list[Basic] | list[bool]) -> Series:
         
-        if not isinstance(index, slice):
-            raise TypeError("_get_corrected_slice_from_slice_of_items only takes slice.")
+        data = self._data
+        if self._is_mask(index):
+            return data._get_data_from_iloc(index)
+        else:
+            return data._get_data_from_iloc(data.index.get_indexer(index))
+    
+    def _get_from_slice(self, index : slice) -> Series:
         
+        data = self._data
         start, stop, step = index.start, index.stop, index.step
-
+        
+        if start is None and stop is None:
+            return data._get_data_from_iloc(index)
+        
         if start is not None:
-            start = self._data.index.get_loc(start, get_all = False)
+            start = data.index.get_loc(start, get_all = False)
         
         if stop is not None:
-            stop = max(self._data.index.get_loc(stop))
+            stop = data.index.get_loc_last(stop)
         
-        corrected_slice = self._data._get_correct_slice(slice(start, stop, step))
+        return data._get_data_from_iloc(data._get_correct_slice(slice(start, stop, step)))
+    
+    def _set_at_label(self, index : Basic, new_data : Any | list[Any]) -> None:
+        
+        data = self._data
+        data._set_items_from_int_indexes(data.index.get_loc(index), new_data)
+    
+    def _set_at_tuple(self, index : BasicTuple, new_data : Any | list[Any]) -> None:
         
-        return corrected_slice
+        self._data._set_items_from_int_indexes(self._data.index.get_indexer((index,)), new_data)
+    
+    def _set_at_list(self, index : list[Basic] | list[bool], new_data : Any | list[Any]) -> None:
+        
+        data = self._data
+        if self._is_mask(index):
+            data._set_items_from_mask(index, new_data)
+        else:
+            data._set_items_from_int_indexes(data.index.get_indexer(index), new_data)
+    
+    def _set_at_slice(self, index : slice, new_data : Any | list[Any]) -> None:
+        
+        data = self._data
+        start, stop, step = index.start, index.stop, index.step
+        
+        if start is None and stop is None:
+            data._set_items_from_int_slice(index, new_data)
+            return
+        
+        if start is not None:
+            start = data.index.get_loc(start, get_all = False)
+        
+        if stop is not None:
+            stop = data.index.get_loc_last(stop)
+        
+        data._set_items_from_int_indexes(data._get_int_indexes_from_slice(data._get_correct_slice(slice(start, stop, step))), new_data)
+    
+    _GET_DISPATCH = {**dict.fromkeys(_LABEL_TYPES, _get_from_label), tuple : _get_from_tuple, list : _get_from_list, slice : _get_from_slice}
+    _SET_DISPATCH = {**dict.fromkeys(_LABEL_TYPES, _set_at_label), tuple : _set_at_tuple, list : _set_at_list, slice : _set_at_slice}
+    
+    @staticmethod
+    def _find_handler(dispatch : dict[type, Any], index : Any) -> Any:
+        '''This method returns the handler registered for the exact type of the index.
+        Subclasses of the supported types (bool for example) miss the exact lookup, so the rest of their mro is looked up in the dispatch table instead.'''
+        
+        for kind in type(index).__mro__:
+            handler = dispatch.get(kind)
+            if handler is not None:
+                return handler
+        
+        _raise_unsupported(index)
 
     def __getitem__(self, index : Basic | list[Basic] | list[bool] | slice) -> Series:
         
-        if isinstance(index, (int, str, float, tuple)):
-            return self._data._get_data_from_iloc(self._data.index.get_loc(index))
-        elif isinstance(index, list):
-            if isinstance(index[0], bool):
-                return self._data._get_data_from_iloc(index)
-            else:
-                locations = []
-                for item in index:
-                    locations.extend(self._data.index.get_loc(item))
-                return self._data._get_data_from_iloc(locations)
-        elif isinstance(index, slice):
-            return self._data._get_data_from_iloc(self._get_correct_slice_from_slice_of_items(index))
-        else:
-            raise TypeError(f"\"{type(index)}\" is not supported.")
+        handler = Loc._GET_DISPATCH.get(type(index)) or self._find_handler(Loc._GET_DISPATCH, index)
+        return handler(self, index)
     
     def __setitem__(self, index : Basic | list[Basic] | list[bool] | slice, new_data : Any | list[Any]) -> None:
         
-        if isinstance(index, (int, str, float, tuple)):
-            indexes_to_change = self._data.index.get_loc(index)
-            if isinstance(indexes_to_change, int):
-                self._data._set_item_from_int_index(indexes_to_change, new_data)
-            elif len(indexes_to_change) == 1:
-                self._data._set_item_from_int_index(indexes_to_change[0], new_data)
-            else:
-                self._data._set_items_from_int_indexes(indexes_to_change, new_data)
-        elif isinstance(index, list):
-            if isinstance(index[0], bool):
-                indexes_to_change = self._data._get_int_indexes_from_mask(index)
-            else:
-                indexes_to_change = []
-                for single_index in index:
-                    indexes_to_change.extend(self._data.index.get_loc(single_index))
-            self._data._set_items_from_int_indexes(indexes_to_change, new_data)
-        elif isinstance(index, slice):
-            self._data._set_items_from_int_indexes(self._data._get_int_indexes_from_slice(self._get_correct_slice_from_slice_of_items(index)), new_data)
-        else:
-            raise TypeError(f"\"{type(index)}\" is not supported.")
\ No newline at end of file
+        handler = Loc._SET_DISPATCH.get(type(index)) or self._find_handler(Loc._SET_DISPATCH, index)
+        handler(self, index, new_data)
@@ -1,7 +1,13 @@
 from __future__ import annotations
 from typing import Sequence, Union, TypeAlias, Any, Generator, Literal
 from collections.abc import Sequence as TypeSequence
-from itertools import product
+from itertools import chain, compress, repeat
+from math import prod
+from types import MappingProxyType
+from sys import intern
+from array import array
+from io import StringIO
+from bisect import bisect_left
 
 BasicTuple : TypeAlias = tuple[Union[str, int, float], ...]
 Basic : TypeAlias = Union[int, str, float, BasicTuple]
@@ -9,13 +15,34 @@ SequenceNotStr : TypeAlias = Union[list[Any], tuple[Any, ...]]
 BasicSequenceNotStr : TypeAlias = Union[list[Basic], tuple[Basic, ...]]
 
 class MultiIndex(object):
+    __slots__ = ("_memory_efficient", "_multiindex", "_mapping", "_reverse_mapping", "_levels",
+                 "_cache_storage", "_cache_enabled",
+                 "_version", "_tuples_memo", "_tuples_memo_version",
+                 "_names", "_names_set")
+    
     def __init__(self, index : list[BasicSequenceNotStr] = None, cache : bool = True, names : BasicSequenceNotStr = None, memory_efficient : bool = False):
+        self._memory_efficient = memory_efficient
         self._multiindex, self._mapping, self._reverse_mapping = self._create_multiindex(index, memory_efficient = memory_efficient)
         self._levels = len(self._multiindex)
-        self._cache = None
+        self._cache_storage = None
+        self._cache_enabled = cache
+        self._version = 0
+        self._tuples_memo = None
+        self._tuples_memo_version = -1
         self.names = names
-        if cache:
+
+    @property
+    def _cache(self) -> dict | None:
+        '''This property returns the cache, building it on first access if caching is enabled.
+        A MultiIndex that is only ever iterated or sliced therefore never pays for building the cache.'''
+        
+        if self._cache_storage is None and self._cache_enabled:
             self._create_cache()
+        return self._cache_storage
+    
+    @_cache.setter
+    def _cache(self, cache : dict | None) -> None:
+        self._cache_storage = cache
 
     @property
     def names(self) -> list:
@@ -39,6 +66,7 @@ class MultiIndex(object):
             names = tuple(names)
                        
         self._names = names
+        self._names_set = frozenset(names) if names else None
 
     @staticmethod
     def _isnan(value : float) -> bool:
@@ -49,6 +77,9 @@ class MultiIndex(object):
     def _verify_item(item : Basic) -> None:
         '''This method checks whether or not the inputted item is str, int, float or a tuple consisting of them.'''
 
+        item_type = type(item)
+        if item_type is int or item_type is str:
+            return
         if item == ():
             raise IndexError("MultiIndex item cannot be empty.")
         if isinstance(item, tuple):
@@ -70,6 +101,8 @@ class MultiIndex(object):
 
         if not tup:
             raise IndexError("MultiIndex tuple cannot be empty.")
+        elif set(map(type, tup)) <= {int, str}:
+            return
         else:
             for item in tup:
                 MultiIndex._verify_item(item)
@@ -83,6 +116,8 @@ class MultiIndex(object):
             raise TypeError("Input must be a sequence.")
         elif isinstance(sequence, (str, bytes)):
             raise TypeError("Sequence cannot be a string or bytes.")
+        elif set(map(type, sequence)) <= {int, str}:
+            return
         else:
             for item in sequence:
                 MultiIndex._verify_item(item)
@@ -119,75 +154,115 @@ class MultiIndex(object):
             MultiIndex._verify_length_of_sequences(tuples)
     
     @staticmethod
-    def _create_multiindex(sequences : list[BasicSequenceNotStr], memory_efficient : bool = False) -> tuple[list[list], dict, dict]:
+    def _create_multiindex(sequences : list[BasicSequenceNotStr], memory_efficient : bool = False) -> tuple[list[array], dict, dict]:
         '''This method is one of the main workhorses of the class. It returns 3 items.
-        First is a list of lists that contain numerical keys pointing to the unique original values that were in the original lists.
+        First is a list of arrays that contain numerical keys pointing to the unique original values that were in the original lists.
         Second is a dictionary of numerical keys mapping to the unique original values that were in the original lists.
         Third is also a dictionary of keys mapping unique original values (as keys) to their numerical keys
         in the second dictionary.'''
         
-        mapping = {}
-        reverse_mapping = {}
-        if memory_efficient:
-            for sequence in sequences:
-                for item in sequence:
-                    if item not in reverse_mapping:
-                        numerical_index = len(mapping)
-                        mapping[numerical_index] = item
-                        reverse_mapping[item] = numerical_index
-        else:
-            unique_items = set()
-            for sequence in sequences:
-                unique_items.update(sequence)
-            for item in unique_items:
-                numerical_index = len(mapping)
-                mapping[numerical_index] = item
-                reverse_mapping[item] = numerical_index
-        
-        data = [[] for _ in range(len(sequences))]
-        for sequence_number, sequence in enumerate(sequences):
-            for item in sequence:
-                data[sequence_number].append(reverse_mapping[item])
+        unique_items = [intern(item) if type(item) is str else item for item in dict.fromkeys(chain.from_iterable(sequences))]
+        
+        mapping = dict(enumerate(unique_items))
+        reverse_mapping = dict(zip(unique_items, range(len(unique_items))))
+        
+        typecode = MultiIndex._get_typecode(len(unique_items), memory_efficient)
+        data = [array(typecode, map(reverse_mapping.__getitem__, sequence)) for sequence in sequences]
         
         return (data, mapping, reverse_mapping)
     
+    @staticmethod
+    def _get_typecode(no_of_keys : int, memory_efficient : bool = False) -> str:
+        '''This method returns the array typecode used to store the numerical keys of the levels.
+        By default the keys are stored as signed 64 bit ints. In memory efficient mode the smallest unsigned typecode
+        that can hold every one of the keys is used instead, so a level with a few hundred unique values takes a byte per row.'''
+        
+        if memory_efficient:
+            for typecode in ("B", "H", "I"):
+                if no_of_keys <= 1 << (8 * array(typecode).itemsize):
+                    return typecode
+        return "q"
+    
+    def _fit_levels_to_mapping(self) -> None:
+        '''This method widens the arrays holding the levels once the mapping has outgrown their typecode.
+        It only ever does something in memory efficient mode, and since the mapping never shrinks, the levels are only ever widened.'''
+        
+        typecode = self._get_typecode(len(self._mapping), self._memory_efficient)
+        if self._multiindex and self._multiindex[0].typecode != typecode:
+            self._multiindex = [array(typecode, level) for level in self._multiindex]
+    
     def _pretty_row_view(self, no_of_rows = 50) -> list[list]:
         '''This method returns a nested list with all the original values filled in to allow for easy debugging
         and a view that is pleasing to look at.'''
         
-        pretty_row_view = []
-        
         if no_of_rows > len(self):
             no_of_rows = len(self)
         
-        for row_index in range(no_of_rows):
-            row = []
-            for index in range(self._levels):
-                row.append(self._mapping[self._multiindex[index][row_index]])
-            pretty_row_view.append(tuple(row))
-        return pretty_row_view
+        return self._decode_rows([level[:no_of_rows] for level in self._multiindex])
+    
+    @staticmethod
+    def _pretty_level_view(level : array, edge_items : int = 10) -> str:
+        '''This method returns the numerical keys of a level as a list, for __repr__.
+        Levels longer than twice the edge items only show the first and last edge items, so the view stays small for huge MultiIndexes.'''
+        
+        if len(level) <= 2 * edge_items:
+            return str(list(level))
+        return f"{str(list(level[:edge_items]))[:-1]}, ..., {str(list(level[-edge_items:]))[1:]}"
+    
+    def _decode_rows(self, levels : list[array] | list[compress] | list[map]) -> list[tuple]:
+        '''This method turns the provided levels (made up of numerical keys) back into rows of original values.'''
+        
+        mapping = self._mapping
+        return list(zip(*[map(mapping.__getitem__, level) for level in levels]))
     
     def _create_cache(self) -> None:
         '''This method creates a mapping that maps internal state (made up of ints as keys mapping to original data) rows
         to their positions in the MultiIndex. It allows for faster lookups (O(1)) of rows.
         It is also used to verify data integrity.'''
         
-        cache = {}
-        for row_index in range(len(self)):
-            row = []
-            for level in range(self._levels):
-                row.append(self._multiindex[level][row_index])
-            row = tuple(row)
-            if row not in cache:
-                cache[row] = [row_index]
-            else:
-                cache[row].append(row_index)
+        rows = list(zip(*self._multiindex))
+        cache = {row : [] for row in rows}
+        
+        for row_index, row in enumerate(rows):
+            cache[row].append(row_index)
+        
+        self._cache_enabled = True
         self._cache = cache
     
     def _flush_cache(self) -> None:
-        '''This method sets cache to None, freeing up memory that might have been used by the cache.'''
+        '''This method sets cache to None, freeing up memory that might have been used by the cache.
+        It also disables the cache, so it is not built again on the next lookup, and drops the decoded rows kept for to_tuples and iteration.'''
         
+        self._cache_enabled = False
         self._cache = None
+        self._tuples_memo = None
+        self._tuples_memo_version = -1
+    
+    def _shallow_copy(self) -> MultiIndex:
+        '''This method returns an independent copy of the MultiIndex, built from its internal state directly.
+        The levels, mappings and cache buckets are copied, so changing the copy never changes the original,
+        but no row is decoded, verified or hashed again.'''
+        
+        new = MultiIndex.__new__(MultiIndex)
+        new._memory_efficient = self._memory_efficient
+        new._multiindex = [level[:] for level in self._multiindex]
+        new._mapping = self._mapping.copy()
+        new._reverse_mapping = self._reverse_mapping.copy()
+        new._levels = self._levels
+        
+        if self._cache_storage is None:
+            new._cache_storage = None
+        else:
+            new._cache_storage = {internal_form : rows[:] for internal_form, rows in self._cache_storage.items()}
+        new._cache_enabled = self._cache_enabled
+        
+        new._version = self._version
+        new._tuples_memo = self._tuples_memo
+        new._tuples_memo_version = self._tuples_memo_version
+        
+        new._names = self._names
+        new._names_set = self._names_set
+        return new
     
     @staticmethod
     def rows_to_long_columns(rows : Sequence[Sequence[Basic]]) -> list[BasicSequenceNotStr]:
@@ -197,12 +272,10 @@ class MultiIndex(object):
         (all rows need to be equal length).
         eg: if each row contains 4 items, then there will be 4 lists in the nested list.'''
 
-        list_of_lists = [[] for _ in range(len(rows[0]))]
-
-        for row in rows:
-            for i, item in enumerate(row):
-                list_of_lists[i].append(item)
-        return list_of_lists
+        if not rows:
+            raise IndexError("There needs to be at least one row to form the columns.")
+        
+        return [list(column) for column in zip(*rows)]
     
     @staticmethod
     def from_tuples(index : Sequence[BasicTuple], names = None, cache : bool = True, memory_efficient : bool = False) -> MultiIndex:
@@ -228,19 +301,19 @@ class MultiIndex(object):
         '''This method will take two or more Sequences that are not strings and will form a MultiIndex
         from their cartesian products.'''
         
-        # Ideas for future: Design an algorithem that takes the lists and just converts them directly to list of lists.
-        # Since the final number of lists inside the nested list == number of levels == number of inputted lists in .from_product
-        # It should be possible. Though this isn't half bad either, that would probably be much more faster.
-        # Just something to consider for next time.
-        # Right now, I just want this to work and design the other features as well to get this into working shape first.
-        
         if not len(index) > 1:
             raise IndexError("There needs to be 2 or more sequences to form a MultiIndex from products.")
         MultiIndex._verify_sequences(index, check_len=False)
         
-        products = list(product(*index))
+        sizes = [len(sequence) for sequence in index]
+        if not all(sizes):
+            raise IndexError("Sequences used to form a MultiIndex from products cannot be empty.")
+        
+        list_of_lists = []
+        for level, sequence in enumerate(index):
+            block = list(chain.from_iterable(repeat(item, prod(sizes[level + 1:])) for item in sequence))
+            list_of_lists.append(block * prod(sizes[:level]))
         
-        list_of_lists = MultiIndex.rows_to_long_columns(products)
         return MultiIndex(list_of_lists, names = names, cache=cache, memory_efficient = memory_efficient)
     
     def verify_integrity(self, full : bool = True) -> str:
@@ -254,42 +327,25 @@ class MultiIndex(object):
         reverse_mapping_integrity = 1
 
         mapping_keys = set(self._mapping.keys())
-        reverse_mapping_keys = set(self._reverse_mapping.keys())
         reverse_mapping_values = set(self._reverse_mapping.values())
         
         lengths = {len(column) for column in self._multiindex}
         if len(lengths) != 1:
             internal_multiindex_state = 0
-        all_mapping_keys = set()
-        for column in self._multiindex:
-            all_mapping_keys.update(column)
-
-        for key in all_mapping_keys:
-            if not key in mapping_keys or key not in reverse_mapping_values:
-                mapping_integrity = 0
-                break
-        
-        for mapping_key in mapping_keys:
-            mapped_value = self._mapping[mapping_key]
-            if not mapped_value in reverse_mapping_keys:
-                reverse_mapping_integrity = 0
-                break
-            reverse_mapped_key = self._reverse_mapping[mapped_value]
-            if not reverse_mapped_key == mapping_key:
-                reverse_mapping_integrity = 0
+        
+        all_mapping_keys = set().union(*self._multiindex)
+        if not all_mapping_keys <= mapping_keys & reverse_mapping_values:
+            mapping_integrity = 0
+        
+        if not all(map(self._reverse_mapping.items().__contains__, zip(self._mapping.values(), self._mapping.keys()))):
+            reverse_mapping_integrity = 0
         
         if len(self._mapping.values()) != len(set(self._mapping.values())):
             mapping_integrity = 0
         
         if full:
-            for reverse_mapping_key in reverse_mapping_keys:
-                reverse_mapped_value = self._reverse_mapping[reverse_mapping_key]
-                if not reverse_mapped_value in mapping_keys:
-                    reverse_mapping_integrity = 0
-                    break
-                mapped_key = self._mapping[reverse_mapped_value]
-                if not mapped_key == reverse_mapping_key:
-                    reverse_mapping_integrity = 0
+            if not all(map(self._mapping.items().__contains__, zip(self._reverse_mapping.values(), self._reverse_mapping.keys()))):
+                reverse_mapping_integrity = 0
 
         integrity_checkers_int = (internal_multiindex_state, mapping_integrity, reverse_mapping_integrity)
         integrity_checkers_dict = {0 : "internal_multiindex_state", 1 : "mapping_integrity", 2 : "reverse_mapping_integrity"}
@@ -320,69 +376,96 @@ class MultiIndex(object):
         "give_error" - which is by default true will raise an error if the provided MultiIndex is not found anywhere in the MultiIndex.
         It can be set to false to not give an error and instead return None if the provided index is not found anywhere in the MultiIndex.'''
         
-        self._verify_tuple(tup)
+        reverse_mapping = self._reverse_mapping
+        try:
+            internal_form = tuple(map(reverse_mapping.__getitem__, tup)) if type(tup) is tuple else None
+        except (KeyError, TypeError):
+            internal_form = None
+        
+        if internal_form is None:
+            self._verify_tuple(tup)
         if len(tup) != self._levels:
             raise IndexError("Length of the MultiIndex you want to find needs to match the number of levels.")
-        internal_form = []
-        for level, item in enumerate(tup):
-            if item not in self._reverse_mapping:
-                if give_error:
-                    raise KeyError(f"Value not found in entered index for search at level : \"{level}\". There is no such value as \"{item}\" in any level.")
-                else:
-                    return None
-            internal_form.append(self._reverse_mapping[item])
-
-        internal_form = tuple(internal_form)
-        
-        all_instances = []
+        if internal_form is None:
+            for level, item in enumerate(tup):
+                if item not in reverse_mapping:
+                    if give_error:
+                        raise KeyError(f"Value not found in entered index for search at level : \"{level}\". There is no such value as \"{item}\" in any level.")
+                    else:
+                        return None
+            internal_form = tuple(map(reverse_mapping.__getitem__, tup))
         
         if not self._cache:
-            for row_index in range(len(self)):
-                for level, value_to_match in enumerate(internal_form):
-                    if value_to_match != self._multiindex[level][row_index]:
-                        break
-                else:
-                    if not get_all:
-                        return row_index
-                    all_instances.append(row_index)
-                        
-        else:
+            matches = compress(range(len(self)), map(internal_form.__eq__, zip(*self._multiindex)))
             if not get_all:
-                try:
-                        return self._cache[internal_form][0]
-                except:
-                    pass
+                row_index = next(matches, None)
+                if row_index is not None:
+                    return row_index
             else:
-                return self._cache[internal_form]
+                all_instances = list(matches)
+                if all_instances:
+                    return all_instances
+                        
+        else:
+            locations = self._cache.get(internal_form)
+            if locations:
+                return locations if get_all else locations[0]
 
         if give_error:
             raise ValueError(f"MultiIndex : \"{tup}\" not found.")
         else:
             return None
     
-    def show_cache(self) -> dict:
-        '''This method returns a shallow copy of the cache to allow for easy debugging.'''
+    def get_loc_last(self, tup : tuple) -> int:
+        '''This method returns the integer index location of the last appearance of the provided MultiIndex.
+        The cached locations are kept sorted, so the last one is simply the end of the list.'''
+        
+        return self.get_loc(tup)[-1]
+    
+    def get_indexer(self, tups : Sequence[BasicTuple]) -> list[int]:
+        '''This method returns the integer index locations of every MultiIndex inside "tups" in a single call, in the order they are given.
+        MultiIndexes that appear more than once contribute every one of their locations.'''
+        
+        if self._cache is not None:
+            reverse_mapping, cache = self._reverse_mapping, self._cache
+            try:
+                internal_forms = [tuple(map(reverse_mapping.__getitem__, tup)) if type(tup) is tuple else None for tup in tups]
+                return list(chain.from_iterable([cache[internal_form] for internal_form in internal_forms]))
+            except (KeyError, TypeError):
+                pass
+        
+        return list(chain.from_iterable(map(self.get_loc, tups)))
+    
+    def show_cache(self) -> MappingProxyType | None:
+        '''This method returns a read only view of the cache to allow for easy debugging.
+        The view reflects the live cache without copying it. The buckets inside it are the cache's own lists, so they must not be modified.'''
         
         if self._cache:
-            return dict(self._cache)
+            return MappingProxyType(self._cache)
         else:
             return None
     
     def get_raw_internal_multiindex(self) -> list[list]:
         '''This method returns a shallow copy of the raw internal state of the MultiIndex to allow for easy debugging.'''
         
-        return list(self._multiindex)
+        return [list(level) for level in self._multiindex]
+    
+    def _get_memoized_tuples(self) -> list[tuple]:
+        '''This method returns the decoded rows of the MultiIndex, decoding them again only if the rows changed since the last call.
+        In memory efficient mode the rows are decoded on every call instead of being kept.
+        The returned list is shared, so it must not be modified.'''
+        
+        if self._memory_efficient:
+            return self._decode_rows(self._multiindex)
+        if self._tuples_memo_version != self._version:
+            self._tuples_memo = self._decode_rows(self._multiindex)
+            self._tuples_memo_version = self._version
+        return self._tuples_memo
     
     def to_tuples(self) -> list[tuple]:
         '''The method returns a list of tuples as the rows of the MultiIndex consisting of their original values.'''
         
-        rows = []
-        for row_index in range(len(self)):
-            row = []
-            for level in range(self._levels):
-                row.append(self._mapping[self._multiindex[level][row_index]])
-            rows.append(tuple(row))
-        return rows
+        return list(self._get_memoized_tuples())
     
     def is_unique(self) -> bool:
         '''This method returns True if all the row indexes present inside of the MultiIndex are unique.
@@ -391,7 +474,7 @@ class MultiIndex(object):
         if self._cache:
             is_unique = len(self) == len(self._cache)
         else:
-            is_unique = len(self) == len(set(self.to_tuples()))
+            is_unique = len(self) == len(set(zip(*self._multiindex)))
         return is_unique
     
     def get_row_by_int_index(self, index : int) -> list:
@@ -418,6 +501,12 @@ class MultiIndex(object):
         elif isinstance(index, (str, bytes)):
             raise TypeError("get_rows_by_int_index_method does not allow string or bytes as the sequence supposed to contain integers.")
         
+        length = len(self)
+        if set(map(type, index)) <= {int}:
+            positions = [position + length if position < 0 else position for position in index]
+            if not positions or max(positions) < length:
+                return self._decode_rows([map(level.__getitem__, positions) for level in self._multiindex])
+        
         rows = []
         for index in index:
             row = self.get_row_by_int_index(index)
@@ -436,56 +525,35 @@ class MultiIndex(object):
         if not isinstance(index, slice):
             raise TypeError(f"\"{type(index)}\" is not a valid type. Only slice type is accepted in get_row_by_slice method.")
         
+        length = len(self)
         start, stop, step = index.start, index.stop, index.step
-        if step == None:
+        if step is None:
             step = 1
         
-        indexes = [start, stop]
-        for i, index in enumerate(indexes):
-            if index != None:
-                if index < 0:
-                    index = len(self) + index
-                if 0 > index or index >= len(self):
-                    raise IndexError(f"Index \"{indexes[i]}\" out of bounds.")
-                else:
-                    indexes[i] = index
-        
-        start, stop = indexes[0], indexes[1]
-        
-        if step > 0:
-            if start != None and stop != None:
-                if start > stop:
-                    start, stop = stop, start
-                if stop == len(self)-1:
-                    stop = None
-                else:
-                    stop += 1
-            elif stop != None:
-                if stop == len(self)-1:
-                    stop = None
+        bounds = []
+        for bound in (start, stop):
+            if bound is not None:
+                original_bound = bound
+                if bound < 0:
+                    bound += length
+                if not 0 <= bound < length:
+                    raise IndexError(f"Index \"{original_bound}\" out of bounds.")
+            bounds.append(bound)
+        start, stop = bounds
+        
+        if stop is not None:
+            if step > 0:
+                if start is not None:
+                    start, stop = min(start, stop), max(start, stop)
+                stop = stop + 1 if stop != length - 1 else None
+            elif step < 0:
+                if start is not None:
+                    start, stop = max(start, stop), min(start, stop)
+                    stop = stop - 1 if stop != 0 else None
                 else:
-                    stop += 1
-        
+                    # [None:4:-1] selects from 4 down to the first row, which is [4:None:-1].
+                    start, stop = (stop if stop != length - 1 else None), None
         
-        elif step < 0:
-            
-            #lets say I have this : [1:4:-1]
-            if start != None and stop != None:
-                if start < stop:
-                    start, stop = stop, start
-                    #[4:1:-1]
-                if stop == 0:
-                    stop = None
-                else:
-                    stop -= 1
-                    #[4:0:-1] Perfect.
-            #now lets say I have this: [None:4:-1]
-            elif start == None and stop != None:
-                start, stop = stop, start
-                # [4:None:-1] Perfect.
-                if start == len(self) -1:
-                    start = None
-                    
         return slice(start, stop, step)
     
     def get_rows_by_slice(self, index : slice) -> list[tuple]:
@@ -496,42 +564,31 @@ class MultiIndex(object):
         
         corrected_slice = self._get_correct_slice(index)
         
-        columns = []
-        
-        for level in range(self._levels):
-            column = self._multiindex[level][corrected_slice]
-            columns.append(column)
-        
-        rows = []
-        for row_index in range(len(columns[0])):
-            row = []
-            for level in range(self._levels):
-                row.append(self._mapping[columns[level][row_index]])
-            rows.append(tuple(row))
-        return rows
+        return self._decode_rows([level[corrected_slice] for level in self._multiindex])
     
-    def _get_row_indexes_from_mask(self, index : list[bool]) -> list[int]:
-        '''This method returns the indexes of the rows where the mask is True.'''
+    def _verify_mask(self, index : list[bool]) -> None:
+        '''This method checks whether the mask is as long as the MultiIndex and made up of nothing but bools.
+        The types are checked in a single pass over the set of types present inside the mask.'''
         
         if len(index) != len(self):
             raise IndexError("The mask needs to be the same length as the number of rows.")
         
-        indexes = []
+        if not set(map(type, index)) <= {bool}:
+            raise TypeError("Each and every entry inside of a mask needs to be a bool.")
+    
+    def _get_row_indexes_from_mask(self, index : list[bool]) -> list[int]:
+        '''This method returns the indexes of the rows where the mask is True.'''
         
-        for i, Bool in enumerate(index):
-            if not isinstance(Bool, bool):
-                raise TypeError("Each and every entry inside of a mask needs to be a bool.")
-            elif Bool:
-                indexes.append(i)
+        self._verify_mask(index)
 
-        return indexes
+        return list(compress(range(len(index)), index))
         
     def get_rows_from_mask(self, index : list[bool]) -> list[list[tuple]]:
         '''This method returns all the rows where the bool in the mask is True.'''
         
-        indexes = self._get_row_indexes_from_mask(index)
+        self._verify_mask(index)
         
-        return self.get_rows_by_int_index(indexes)
+        return self._decode_rows([compress(level, index) for level in self._multiindex])
             
     def __len__(self) -> int:
         '''This method returns the length of the first column of the MultiIndex.
@@ -564,6 +621,8 @@ class MultiIndex(object):
         '''This method updates both the mappings (self._mapping and self._reverse_mapping) with the new mapping value.'''
         
         if new_mapping not in self._reverse_mapping:
+            if type(new_mapping) is str:
+                new_mapping = intern(new_mapping)
             length = len(self._mapping)
             self._mapping[length] = new_mapping
             self._reverse_mapping[new_mapping] = length
@@ -583,6 +642,8 @@ class MultiIndex(object):
             self._verify_item(new_mappings)
             self._update_mappings_with_single_item(new_mappings)
         
+        self._fit_levels_to_mapping()
+        
     def _verify_new_row(self, new_row : list[Basic]) -> None:
         '''This method verifies whether all the values inside of a soon to be added (usually) row are correct or not.'''
         
@@ -591,6 +652,17 @@ class MultiIndex(object):
         for item in new_row:
             self._verify_item(item)
     
+    def _is_row_mapped(self, new_row : list[Basic]) -> bool:
+        '''This method returns True if the row has the right number of levels and every item in it already has a mapping.
+        Only verified items are ever given a mapping, so such a row needs neither verifying nor adding to the mappings.'''
+        
+        if len(new_row) != self._levels:
+            return False
+        try:
+            return all(map(self._reverse_mapping.__contains__, new_row))
+        except TypeError:
+            return False
+    
     def _get_internal_form_by_int_index(self, index : int) -> tuple[int, ...]:
         '''This method returns the internal form of the row of the MultiIndex by its numerical index.'''
         
@@ -599,16 +671,12 @@ class MultiIndex(object):
         elif index >= len(self):
             raise IndexError("Index out of bounds.")
         
-        internal_form = []
-        for level in range(self._levels):
-            internal_form.append(self._multiindex[level][index])
-
-        return tuple(internal_form)
+        return tuple([level[index] for level in self._multiindex])
     
     def _update_cache(self, operation : Literal["add", "remove"], operation_args : dict[tuple, list[int]], by_internal_form : bool = True) -> None:
         '''This function can be used to either add or remove a numerical index reference of a row to/from the cache.'''
         
-        if self._cache is None:
+        if self._cache_storage is None:
             return
         
         #This was an absolute pain to build. Wow.
@@ -621,34 +689,34 @@ class MultiIndex(object):
             raise ValueError("\"add\" or \"remove\" are the only valid operation specifiers.")
         
         if not by_internal_form:
-        
-            internal_forms = []
+            
             for single_index in operation_args.keys():
-                internal_form = []
                 for item in single_index:
                     if item not in self._reverse_mapping:
                         raise KeyError(f"Mapping not found for \"{item}\" in \"{single_index}\". Verify whether it is really inside the MultiIndex.\n If it is, verify mapping, reverse mapping integrities.")
-                    internal_form.append(self._reverse_mapping[item])
-                internal_forms.append(tuple(internal_form))
-        else:
-            
-            internal_forms = list(operation_args.keys())
+            operation_args = {tuple(map(self._reverse_mapping.__getitem__, single_index)) : rows for single_index, rows in operation_args.items()}
+        
+        cache = self._cache
+        length = len(self)
         
-        for i, tup in enumerate(operation_args.keys()):
-            for row in operation_args[tup]:
-                if row >= len(self):
+        for internal_form, rows in operation_args.items():
+            for row in rows:
+                if row >= length:
                     raise IndexError(f"Index \"{row}\" out of bounds.")
-                
-                if operation == "add":
-                    if internal_forms[i] in self._cache:
-                        self._cache[internal_forms[i]].append(row)
-                    else:
-                        self._cache[internal_forms[i]] = [row]
-                else:
-                    if row not in self._cache[internal_forms[i]]:
+            
+            if operation == "add" and rows:
+                bucket = cache.setdefault(internal_form, [])
+                bucket.extend(rows)
+                bucket.sort()
+            elif operation == "remove":
+                bucket = cache.get(internal_form, [])
+                for row in rows:
+                    position = bisect_left(bucket, row)
+                    if position == len(bucket) or bucket[position] != row:
                         raise ValueError(f"\"{row}\" not found in cache for the specified MultiIndex. The MultiIndex at {row} is {self[row]}")
-                    self._cache[internal_forms[i]].remove(row)
-            self._cache[internal_forms[i]].sort()
+                    del bucket[position]
+                    if not bucket:
+                        del cache[internal_form]
         
     def _set_int_index(self, index : int, new_data : list[Basic], verify_data : bool = True, update_mappings : bool = True, update_cache : bool = True) -> None:
         '''This method is an internal helper method of __setitem__.
@@ -659,19 +727,33 @@ class MultiIndex(object):
         if not isinstance(index, int):
             raise TypeError("_set_int_index method only takes an int as the index to be set.")
 
-        if verify_data:
+        already_mapped = (verify_data or update_mappings) and self._is_row_mapped(new_data)
+        
+        if verify_data and not already_mapped:
             self._verify_new_row(new_data)
 
-        if update_mappings:
+        if update_mappings and not already_mapped:
             self.update_mappings_with(new_data)
         
-        if update_cache:
-            self._update_cache("remove", {self[index] : [index]}, by_internal_form = False)
-            self._update_cache("add", {tuple(new_data) : [index]}, by_internal_form = False)
-
-        for level, item in enumerate(new_data):
-            item_mapping = self._reverse_mapping[item]
-            self._multiindex[level][index] = item_mapping
+        self._set_int_index_mapped(index, tuple(map(self._reverse_mapping.__getitem__, new_data)), update_cache = update_cache)
+    
+    def _set_int_index_mapped(self, index : int, new_internal_form : tuple[int, ...], update_cache : bool = True) -> None:
+        '''This method is an internal helper method of the setters.
+        It replaces the row at the specified numerical index by a row that is already in its internal form,
+        so neither the old nor the new row has to be translated through the mappings again.'''
+        
+        length = len(self)
+        if not -length <= index < length:
+            raise IndexError(f"Index \"{index}\" out of bounds.")
+        index %= length
+        
+        if update_cache and self._cache_storage is not None:
+            self._update_cache("remove", {self._get_internal_form_by_int_index(index) : [index]})
+            self._update_cache("add", {new_internal_form : [index]})
+        
+        for level_keys, item_mapping in zip(self._multiindex, new_internal_form):
+            level_keys[index] = item_mapping
+        self._version += 1
 
         
     def _set_multiple_int_indexes(self, index : Sequence[int], new_data : list[Basic]) -> None:
@@ -684,13 +766,40 @@ class MultiIndex(object):
             if isinstance(index, (str, bytes)):
                 raise TypeError("strings or bytes are not a valid sequence type for _set_multiple_int_indexes")
             else:
-                self._verify_new_row(new_data)
-                self.update_mappings_with(new_data)
+                # Every index is checked before the mappings are updated, so a bad index leaves the MultiIndex untouched.
+                length = len(self)
+                rows = []
                 for row_index in index:
-                    self._set_int_index(row_index, new_data, verify_data = False, update_mappings = False)
+                    if not isinstance(row_index, int):
+                        raise TypeError(f"\"{type(row_index)}\" is not a valid numerical index.")
+                    if not -length <= row_index < length:
+                        raise IndexError(f"Index \"{row_index}\" out of bounds.")
+                    rows.append(row_index % length)
+                rows = list(dict.fromkeys(rows))
+                if not rows:
+                    return
+                
+                if not self._is_row_mapped(new_data):
+                    self._verify_new_row(new_data)
+                    self.update_mappings_with(new_data)
+                
+                new_data_internal_form = tuple(map(self._reverse_mapping.__getitem__, new_data))
+                
+                if self._cache_storage is not None:
+                    rows_to_remove = {}
+                    for row_index in rows:
+                        rows_to_remove.setdefault(self._get_internal_form_by_int_index(row_index), []).append(row_index)
+                    
+                    self._update_cache("remove", rows_to_remove)
+                    self._update_cache("add", {new_data_internal_form : rows})
+                
+                for level_keys, item_mapping in zip(self._multiindex, new_data_internal_form):
+                    for row_index in rows:
+                        level_keys[row_index] = item_mapping
+                self._version += 1
     
-    def _get_int_indexes_from_slice(self, index : slice) -> list[int]:
-        '''This method is an internal helper method that returns a list consisting of all the valid numerical indexes
+    def _get_int_indexes_from_slice(self, index : slice) -> range:
+        '''This method is an internal helper method that returns a range consisting of all the valid numerical indexes
         that would fall under the slice according to my slice semantics.'''
         
         if not isinstance(index, slice):
@@ -711,12 +820,7 @@ class MultiIndex(object):
             else:
                 stop = -1
         
-        int_indexes = []
-        while (step > 0 and start < stop) or (step < 0 and start > stop):
-            int_indexes.append(start)
-            start += step
-
-        return int_indexes
+        return range(start, stop, step)
     
     def _set_rows_by_slice(self, index : slice, new_data : list[Basic], update_cache : bool = True) -> None:
         '''This method is an internal helper method of __setitem__.
@@ -726,21 +830,27 @@ class MultiIndex(object):
         
         corrected_slice = self._get_correct_slice(index)
 
-        self._verify_new_row(new_data)
-        self.update_mappings_with(new_data)
+        if not self._is_row_mapped(new_data):
+            self._verify_new_row(new_data)
+            self.update_mappings_with(new_data)
 
-        if update_cache:
-            int_indexes = self._get_int_indexes_from_slice(corrected_slice)
-            new_data_internal_form = tuple([self._reverse_mapping[item] for item in new_data])
+        int_indexes = self._get_int_indexes_from_slice(corrected_slice)
+        new_data_internal_form = tuple(map(self._reverse_mapping.__getitem__, new_data))
         
-            for row_index in int_indexes:
-                row_internal_form = self._get_internal_form_by_int_index(row_index)
-                self._update_cache("remove", {row_internal_form : [row_index]})
-                self._update_cache("add", {new_data_internal_form : [row_index]})
+        if update_cache and self._cache_storage is not None:
+
+            rows_to_remove = {}
+            for row_index, row_internal_form in zip(int_indexes, zip(*[level[corrected_slice] for level in self._multiindex])):
+                rows_to_remove.setdefault(row_internal_form, []).append(row_index)
+
+            self._update_cache("remove", rows_to_remove)
+            self._update_cache("add", {new_data_internal_form : int_indexes})
         
-        for level, item in enumerate(new_data):
-            item_mapping = self._reverse_mapping[item]
-            self._multiindex[level][corrected_slice] = [item_mapping] * len(self._multiindex[0][corrected_slice])
+        no_of_rows = len(int_indexes)
+        
+        for level_keys, item_mapping in zip(self._multiindex, new_data_internal_form):
+            level_keys[corrected_slice] = array(level_keys.typecode, [item_mapping]) * no_of_rows
+        self._version += 1
     
     def _compare_names(self, second : MultiIndex) -> bool:
         '''This method compares the names of the current MultiIndex to another. Returns True if they match, else False.'''
@@ -748,11 +858,7 @@ class MultiIndex(object):
         if not self.names or not second.names or (self._levels != second._levels):
             return False
         
-        for name in self.names:
-            if name not in second.names:
-                return False
-        
-        return True
+        return self._names_set == second._names_set
     
     @staticmethod
     def _add_multiindexes(first : MultiIndex, second : MultiIndex, inplace : bool = False) -> MultiIndex | None:
@@ -765,30 +871,36 @@ class MultiIndex(object):
             raise IndexError("Number of levels of the first MultiIndex must be the same as the number of levels of the second MultiIndex for them to be concatenated.")
         
         if not inplace:
-            first = MultiIndex.from_tuples(first.to_tuples())
+            # The added MultiIndex has never carried the names over, so its levels are extended in their given order.
+            first = first._shallow_copy()
+            first.names = None
 
         first.update_mappings_with(list(second._reverse_mapping.keys()))
         
-        names_match = first._compare_names(second)
+        if first._compare_names(second):
+            level_of_name = {name : level for level, name in enumerate(first.names)}
+            level_map = [level_of_name[name] for name in second.names]
+        else:
+            level_map = list(range(first._levels))
+        
+        second_mapping = second._mapping
+        key_translation = dict(zip(second_mapping.keys(), map(first._reverse_mapping.__getitem__, second_mapping.values())))
+        
+        typecode = first._multiindex[0].typecode
         
-        for level in range(first._levels):
-            level_to_extend = []
-            seconds_level = second._multiindex[level]
-            for mapping in seconds_level:
-                actual_value = second._mapping[mapping]
-                level_to_extend.append(first._reverse_mapping[actual_value])
+        for level, target_level in enumerate(level_map):
+            level_to_extend = array(typecode, map(key_translation.__getitem__, second._multiindex[level]))
+            first._multiindex[target_level] += level_to_extend
+        first._version += 1
+        
+        if first._cache_storage is not None:
+            first_new_row = len(first) - len(second)
             
-            if names_match:
-                level = first.names.index(second.names[level])
+            new_rows = {}
+            for row_index, row_internal_form in enumerate(zip(*[level[first_new_row:] for level in first._multiindex]), first_new_row):
+                new_rows.setdefault(row_internal_form, []).append(row_index)
             
-            first._multiindex[level].extend(level_to_extend)
-        
-        if first._cache:
-            range_start_of_rows_to_update = len(first) - len(second)
-            range_stop_of_rows_to_update = len(first)
-
-            for row_index in range(range_start_of_rows_to_update, range_stop_of_rows_to_update):
-                first._update_cache("add", {first._get_internal_form_by_int_index(row_index) : [row_index]})
+            first._update_cache("add", new_rows)
             
         if not inplace:
             return first
@@ -798,25 +910,56 @@ class MultiIndex(object):
         
         self._add_multiindexes(self, second, inplace = True)
             
+    def set_int(self, index : int, new_data : list[Basic]) -> None:
+        '''This method replaces the row at the numerical index by the new row.'''
+        
+        self._set_int_index(index, new_data)
+    
+    def set_ints(self, indexes : list[int], new_data : list[Basic]) -> None:
+        '''This method replaces the rows at all the numerical indexes by the new row.'''
+        
+        self._set_multiple_int_indexes(indexes, new_data)
+    
+    def set_mask(self, mask : list[bool], new_data : list[Basic]) -> None:
+        '''This method replaces every row selected by the boolean mask by the new row.'''
+        
+        self._set_multiple_int_indexes(self._get_row_indexes_from_mask(mask), new_data)
+    
+    def set_slice(self, index : slice, new_data : list[Basic]) -> None:
+        '''This method replaces the rows selected by the slice (according to the custom slicing semantics) by the new row.'''
+        
+        self._set_rows_by_slice(index, new_data)
+    
+    def _set_from_list(self, index : list[int] | list[bool], new_data : list[Basic]) -> None:
+        '''This method is an internal helper method of __setitem__. It sends a list index to set_mask or set_ints.
+        An empty list is treated as an empty list of numerical indexes, so it selects nothing.'''
+        
+        first_type = type(index[0]) if index else int
+        
+        if first_type is bool:
+            self.set_mask(index, new_data)
+        
+        elif not issubclass(first_type, int):
+            raise TypeError(f"\"{first_type}\" is not a supported lookup type.")
+        
+        else:
+            self.set_ints(index, new_data)
+    
+    _SETITEM_DISPATCH = {int : set_int, list : _set_from_list, slice : set_slice}
+    
     def __setitem__(self, index : int | list[int] | list[bool] | slice, new_data : list[Basic]) -> None:
         '''This method allows you to set new MultiIndexes to the index you provided.
         I will be extremely disappointed if you don't use this atleast once because it was an absolute pain to make.
-        This method can take one numerical index, a list of numerical indexes, a boolean mask or even a slice.'''
+        This method can take one numerical index, a list of numerical indexes, a boolean mask or even a slice.
+        Callers that always set the same kind of index can call set_int, set_ints, set_mask or set_slice directly.'''
         
-        if isinstance(index, int):
-            self._set_int_index(index, new_data)
-
-        elif isinstance(index, list):
-            if isinstance(index[0], bool):
-                index = self._get_row_indexes_from_mask(index)
-            
-            elif not isinstance(index[0], int):
-                raise TypeError(f"\"{type(index[0])}\" is not a supported lookup type.")
-            
-            self._set_multiple_int_indexes(index, new_data)
-            
-        elif isinstance(index, slice):
-            self._set_rows_by_slice(index, new_data)
+        handler = MultiIndex._SETITEM_DISPATCH.get(type(index))
+        
+        if handler is None:
+            handler = next((setter for kind, setter in MultiIndex._SETITEM_DISPATCH.items() if isinstance(index, kind)), None)
+        
+        if handler is not None:
+            handler(self, index, new_data)
     
     def __add__(self, second):
         '''This method returns a new MultiIndex consisting of both itself and the second MultiIndexes added together.'''
@@ -826,7 +969,7 @@ class MultiIndex(object):
     def __iter__(self) -> Generator:
         '''returns an iterator providing tuples of rows of the MultiIndexes returned to their original values.'''
         
-        return iter(self.to_tuples())
+        return iter(self._get_memoized_tuples())
     
     def __contains__(self, item : BasicTuple) -> bool:
         '''This method returns True if the provided item is present inside the MultiIndex, otherwise it returns False.'''
@@ -834,19 +977,16 @@ class MultiIndex(object):
         if not isinstance(item, tuple) or (self._levels != len(item)):
             return False
         
-        if self._cache:
-            try:
-                internal_form = tuple([self._reverse_mapping[i] for i in item])
-                return internal_form in self._cache
-            except:
-                return False
-        
         try:
-            self.get_loc(item, get_all = False)
-            return True
-        except:
+            internal_form = tuple(map(self._reverse_mapping.get, item))
+        except TypeError:
             return False
         
+        if self._cache is not None:
+            return internal_form in self._cache
+        
+        return internal_form in zip(*self._multiindex)
+        
     def __str__(self) -> str:
         '''This method returns a pretty view of the first 50 rows (by default) of the MultiIndex.'''
         
@@ -860,8 +1000,16 @@ class MultiIndex(object):
         '''This method returns a comprehensive view of all the internal states,
         mappings as well as data integrity of the MultiIndex.'''
         
+        internal_view = StringIO()
+        internal_view.write("[")
+        for level_number, level in enumerate(self._multiindex):
+            if level_number:
+                internal_view.write("\n ")
+            internal_view.write(self._pretty_level_view(level))
+        internal_view.write("]")
+        
         return ("MultiIndex internal view:\n"
-    f"{str(self._multiindex).replace("],", "]\n")}\n\n"
+    f"{internal_view.getvalue()}\n\n"
     f"Mapping :\n{str(self._mapping)}\n\n"
     f"Reverse mapping :\n{str(self._reverse_mapping)}\n\n"
     f"number of levels : {str(self._levels)}\n\n"